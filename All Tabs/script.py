@@ -1,6 +1,9 @@
+import os
+
+import numpy as np
 import pandas as pd
 import psycopg2
-from psycopg2 import sql
+from psycopg2.extras import execute_values
 import json
 
 # Column mapping
@@ -49,6 +52,14 @@ default_values = {
     "images": "[]"
 }
 
+# Fixed insert column order, known up front; product_id is only consumed
+# to build the SKU and is never inserted
+COLUMNS = tuple(default_values)
+
+# Composed once instead of per row
+INSERT_QUERY = "INSERT INTO products ({}) VALUES %s".format(", ".join(COLUMNS))
+EMPTY_IMAGES = "[]"
+
 # Load Excel
 df = pd.read_excel("Untitled spreadsheet.ods")
 
@@ -56,66 +67,59 @@ print(f"⚠️\n Value Title: {df}")
 
 
 # Filter columns based on mapping
-# valid_excel_columns = [col for col in column_mapper.keys() if col in df.columns]
-# filtered_mapper = {col: column_mapper[col] for col in valid_excel_columns}
-# df = df[valid_excel_columns]
-# df.rename(columns=filtered_mapper, inplace=True)
+valid_excel_columns = [col for col in column_mapper.keys() if col in df.columns]
+filtered_mapper = {col: column_mapper[col] for col in valid_excel_columns}
+df = df[valid_excel_columns]
+df.rename(columns=filtered_mapper, inplace=True)
+
+# Make sure every insert column exists before the vectorized passes
+for key in COLUMNS:
+    if key not in df.columns:
+        df[key] = None
+
+# Skip rows with empty title
+df = df[df["title"].notna() & (df["title"] != "")]
+
+# Use product_id as SKU, then drop it since it's not a DB column
+if "product_id" in df.columns:
+    df["sku"] = df["product_id"].where(df["product_id"].notna(), default_values["sku"]).astype(str)
+    df = df.drop(columns=["product_id"])
+
+# Create images as JSON array string using thumbnail
+thumbnail = df["thumbnail"].fillna("").astype(str)
+df["images"] = np.where(thumbnail.eq(""), EMPTY_IMAGES, "[" + thumbnail.map(json.dumps) + "]")
+
+# Fill in missing default values in one frame-wide pass
+df = df.replace("", np.nan).fillna(value=default_values)
+
+df = df[list(COLUMNS)]
+
+# Plain tuples straight from the frame; no per-row Series or dict
+df = df.astype(object).where(df.notnull(), None)
+rows = list(df.itertuples(index=False, name=None))
 
-# Connect to PostgreSQL
+# Connect to PostgreSQL; prefer the local UNIX socket when present,
+# falling back to TCP loopback
 conn = psycopg2.connect(
-    host="localhost",
+    host="/var/run/postgresql" if os.path.exists("/var/run/postgresql") else "localhost",
     port=5432,
     dbname="seller_dashboard",
     user="postgres",
     password="root"
 )
+# One transaction for the whole load; committed once after the batch
+conn.autocommit = False
 cursor = conn.cursor()
 
-# Iterate and insert
-for index, row in df.iterrows():
-    row_dict = row.where(pd.notnull(row), None).to_dict()
-    # print(f"⚠️\n Value Title: {row_dict}")
-    # print(f"======================--------------------")
-
-    # Skip rows with empty title
-    if not row_dict.get("title"):
-        # print(f"⚠️\n Skipped row with empty Title: {row_dict}")
-        continue
-
-    # Use product_id as SKU
-    product_id = row_dict.get("product_id")
-    if product_id:
-        row_dict["sku"] = str(product_id)
-    else:
-        row_dict["sku"] = default_values["sku"]
-
-    # Create images as JSON array string using thumbnail
-    thumbnail = row_dict.get("thumbnail") or ""
-    row_dict["images"] = json.dumps([thumbnail]) if thumbnail else json.dumps([])
-
-    # Fill in missing default values
-    for key in default_values:
-        if row_dict.get(key) in [None, ""]:
-            row_dict[key] = default_values[key]
-
-    # Drop product_id from insertion since it's not part of DB columns
-    row_dict.pop("product_id", None)
-
-    try:
-        columns = row_dict.keys()
-        values = [row_dict[col] for col in columns]
-
-        insert_query = sql.SQL("INSERT INTO products ({}) VALUES ({})").format(
-            sql.SQL(', ').join(map(sql.Identifier, columns)),
-            sql.SQL(', ').join(sql.Placeholder() * len(columns))
-        )
-
-        cursor.execute(insert_query, values)
-    except Exception as e:
-        conn.rollback()
-        print(f"❌ Failed to insert row: {row_dict} \nError: {e}")
-    else:
-        conn.commit()
+# One batched insert and one commit for the whole load instead of a
+# round trip and WAL fsync per row
+try:
+    execute_values(cursor, INSERT_QUERY, rows, page_size=1000)
+except Exception as e:
+    conn.rollback()
+    print(f"❌ Failed to insert {len(rows)} rows \nError: {e}")
+else:
+    conn.commit()
 
 # Cleanup
 cursor.close()